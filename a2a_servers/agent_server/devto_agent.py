@@ -89,5 +89,11 @@ async def run_agent():
 
 
 if __name__ == "__main__":
+    try:
+        # libuv-based event loop; every await in the server benefits.
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     dotenv.load_dotenv()
     asyncio.run(run_agent())
\ No newline at end of file
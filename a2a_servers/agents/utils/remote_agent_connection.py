@@ -1,7 +1,8 @@
 # Import libraries
+import logging
+import sys
 import uuid
 from typing import Callable
-from termcolor import colored
 from a2a_servers.common.client import A2AClient
 from a2a_servers.common.types import (
     AgentCard,
@@ -13,32 +14,94 @@ from a2a_servers.common.types import (
     TaskState,
 )
 
+logger = logging.getLogger(__name__)
+
 TaskCallbackArg = Task | TaskStatusUpdateEvent | TaskArtifactUpdateEvent
 TaskUpdateCallback = Callable[[TaskCallbackArg, AgentCard], Task]
 
+# Hot metadata keys, interned once so per-event dict inserts reuse the same
+# string objects instead of hashing fresh ones.
+_MID = sys.intern('message_id')
+_LMID = sys.intern('last_message_id')
+
 
 class RemoteAgentConnections:
     """A class to hold the connections to the remote agents."""
 
+    # Slots drop the per-instance __dict__ and make attribute access a fixed
+    # offset, which matters when holding many agent connections.
+    __slots__ = (
+        'agent_client',
+        'card',
+        'conversation_name',
+        'conversation',
+        'pending_task_count',
+        '_uuid_pool',
+    )
+
     def __init__(self, agent_card: AgentCard):
-        print(colored(f"Connecting to agent: {agent_card.name} at {agent_card.url}", "yellow"))
+        # %s-style arguments keep the string build lazy when the level is
+        # filtered, and logging does not block the loop the way a piped
+        # stdout print can during connection bursts.
+        logger.info("Connecting to agent: %s at %s", agent_card.name, agent_card.url)
         self.agent_client = A2AClient(agent_card)
         self.card = agent_card
-        print(self.agent_client.url)
+        logger.info("Agent client url: %s", self.agent_client.url)
 
         self.conversation_name = None
         self.conversation = None
-        self.pending_tasks = set()
+        # Nothing queries membership, so a plain counter is enough and avoids
+        # hashing task-id strings (and the ~216 bytes of an empty set).
+        self.pending_task_count = 0
+        self._uuid_pool: list[str] = []
 
     def get_agent(self) -> AgentCard:
         return self.card
 
+    def _next_uuid(self) -> str:
+        """Returns a unique message id from a pre-generated batch, refilling
+        when empty so the os.urandom cost is amortized across events."""
+        if not self._uuid_pool:
+            self._uuid_pool = [uuid.uuid4().hex for _ in range(256)]
+        return self._uuid_pool.pop()
+
+    def _stamp_message_id(self, result, request_message):
+        """Propagates request metadata onto a task status message and gives it
+        a fresh message id. getattr with a default is cheaper than the
+        hasattr ladder, which sets up an exception frame per attribute."""
+        status = getattr(result, 'status', None)
+        message = getattr(status, 'message', None) if status is not None else None
+        if message is None:
+            return
+        merge_metadata(message, request_message)
+        if not message.metadata:
+            message.metadata = {}
+        if _MID in message.metadata:
+            message.metadata[_LMID] = message.metadata[_MID]
+        message.metadata[_MID] = self._next_uuid()
+
+    def _post_process(self, result, request: TaskSendParams):
+        """Merges request metadata into a response result and stamps its
+        status message. Shared by the streaming and non-streaming branches
+        so the hot loop stays small."""
+        merge_metadata(result, request)
+        # For task status updates, we need to propagate metadata and provide
+        # a unique message id.
+        self._stamp_message_id(result, request.message)
+
     async def send_task(
         self,
         request: TaskSendParams,
         task_callback: TaskUpdateCallback | None,
     ) -> Task | None:
-        if self.card.capabilities.streaming:
+        # Serialize the request once; model_dump() walks the whole params
+        # tree and both branches send the same payload.
+        payload = request.model_dump(exclude_none=True, mode='python')
+        # Bind hot attributes to locals so the streaming loop runs on
+        # LOAD_FAST instead of repeated attribute walks per event.
+        card = self.card
+        post_process = self._post_process
+        if card.capabilities.streaming:
             task = None
             if task_callback:
                 task_callback(
@@ -50,59 +113,35 @@ class RemoteAgentConnections:
                             message=request.message,
                         ),
                         history=[request.message],
-                    ), 
-                    self.card
+                    ),
+                    card
                 )
-            async for response in self.agent_client.send_task_streaming(
-                request.model_dump()
-            ):
-                merge_metadata(response.result, request)
-                # For task status updates, we need to propagate metadata and provide
-                # a unique message id.
-                if (
-                    hasattr(response.result, 'status')
-                    and hasattr(response.result.status, 'message') 
-                    and response.result.status.message
-                ):
-                    merge_metadata(response.result.status.message, request.message)
-                    m = response.result.status.message
-                    if not m.metadata:
-                        m.metadata = {}
-                    if 'message_id' in m.metadata:
-                        m.metadata['last_message_id'] = m.metadata['message_id']
-                    m.metadata['message_id'] = str(uuid.uuid4())
-
+            async for response in self.agent_client.send_task_streaming(payload):
+                result = response.result
+                post_process(result, request)
                 if task_callback:
-                    task = task_callback(response.result, self.card)
-                if hasattr(response.result, 'final') and response.result.final:
+                    task = task_callback(result, card)
+                if getattr(result, 'final', False):
                     break
             return task
-        
-        else:  # Non-streaming
-            response = await self.agent_client.send_task(request.model_dump())
-            merge_metadata(response.result, request)
-            # For task status updates, we need to propagate metadata and provide
-            # a unique message id.
-            if (hasattr(response.result, 'status') and
-                    hasattr(response.result.status, 'message') and
-                    response.result.status.message):
-                merge_metadata(response.result.status.message, request.message)
-                m = response.result.status.message
-                if not m.metadata:
-                    m.metadata = {}
-                if 'message_id' in m.metadata:
-                    m.metadata['last_message_id'] = m.metadata['message_id']
-                m.metadata['message_id'] = str(uuid.uuid4())
 
+        else:  # Non-streaming
+            response = await self.agent_client.send_task(payload)
+            post_process(response.result, request)
             if task_callback:
-                task_callback(response.result, self.card)
+                task_callback(response.result, card)
             return response.result
 
 
 def merge_metadata(target, source):
-    if not hasattr(target, 'metadata') or not hasattr(source, 'metadata'):
+    # Called at least twice per streamed event; getattr with a default is
+    # cheaper than two hasattr probes, and dict(smeta) copies at C level
+    # without the kwargs unpack of dict(**smeta).
+    smeta = getattr(source, 'metadata', None)
+    if not smeta:
         return
-    if target.metadata and source.metadata:
-        target.metadata.update(source.metadata)
-    elif source.metadata:
-        target.metadata = dict(**source.metadata)
+    tmeta = getattr(target, 'metadata', None)
+    if tmeta:
+        tmeta.update(smeta)
+    else:
+        target.metadata = dict(smeta)
@@ -1,5 +1,7 @@
 # Import libraries
-import json
+import asyncio
+import sys
+import orjson
 from typing import AsyncIterable, Any, AsyncGenerator, Union
 from a2a_servers.common.server import utils
 from a2a_servers.common.server.task_manager import InMemoryTaskManager
@@ -21,73 +23,226 @@ from a2a_servers.common.types import (
 )
 
 
+# Hot part/message keys and the agent role string, interned once so the dict
+# literals built per streamed event reuse the same string objects.
+_TYPE = sys.intern('type')
+_TEXT = sys.intern('text')
+_DATA = sys.intern('data')
+_AGENT = sys.intern('agent')
+
+# Marks the end of a producer stream on the queue.
+_STREAM_DONE = object()
+
+# Results larger than this are parsed in a worker thread so the event loop
+# keeps serving other streams during the parse.
+_LARGE_RESULT_BYTES = 64 * 1024
+
+
+def _text_part(text) -> dict:
+    """Builds a text part dict with the pre-interned keys."""
+    return {_TYPE: _TEXT, _TEXT: text}
+
+
+def _data_part(data) -> dict:
+    """Builds a data part dict with the pre-interned keys."""
+    return {_TYPE: _DATA, _DATA: data}
+
+# How long to wait for a follow-up incremental update before flushing, in
+# seconds. A wider window coalesces more chatty updates into one event at the
+# cost of added latency.
+_COALESCE_WINDOW = 0.005
+
+
 class AgentTaskManager(InMemoryTaskManager):
     def __init__(self, agent: Any):
         super().__init__()
         self.agent = agent
+        # Shard the store lock by task id so concurrent tasks do not
+        # serialize on one global lock; 16 keeps the index a cheap mask.
+        self._locks = tuple(asyncio.Lock() for _ in range(16))
+
+    def _lock_for(self, task_id: str) -> asyncio.Lock:
+        return self._locks[hash(task_id) & 15]
 
     async def _stream_generator(
-        self, request: SendTaskStreamingRequest
+        self, request: SendTaskStreamingRequest, query: str
     ) -> AsyncGenerator[SendTaskStreamingResponse | JSONRPCResponse, Any]:
+        # Upserting here instead of in on_send_task_subscribe lets the
+        # response start before the store round-trip; it still runs before
+        # the producer's first store update.
+        await self.upsert_task(request.params)
+        # Producer/consumer split: the producer runs the agent stream and the
+        # store updates while this generator only drains the queue, so the
+        # client receives an event while the next one is being prepared. The
+        # bounded queue gives backpressure if the client reads slowly.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=16)
+        producer = asyncio.create_task(self._produce(request, queue, query))
+        try:
+            while True:
+                response = await queue.get()
+                if response is _STREAM_DONE:
+                    break
+                yield response
+        finally:
+            # Reap the producer so a put blocked on a full queue after a
+            # client disconnect cannot leave the task pending forever.
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    async def _agent_stream(
+        self, query: str, session_id: str
+    ) -> AsyncGenerator[dict[str, Any], Any]:
+        """Adapts agent.stream to an async iterable.
+
+        Async agents are iterated directly. If the agent only offers a sync
+        generator, each item is pulled via asyncio.to_thread so a blocking
+        LLM client or tokenizer cannot starve other connections.
+        """
+        stream = self.agent.stream(query, session_id)
+        if hasattr(stream, "__aiter__"):
+            async for item in stream:
+                yield item
+            return
+        while True:
+            item = await asyncio.to_thread(next, stream, _STREAM_DONE)
+            if item is _STREAM_DONE:
+                break
+            yield item
+
+    async def _coalesce_updates(
+        self, agent_stream: AsyncIterable[dict[str, Any]]
+    ) -> AsyncGenerator[dict[str, Any], Any]:
+        """Merges bursts of incremental text updates into single items.
+
+        Each yield on the streaming path pays a full async-generator
+        handshake, so incomplete updates are concatenated and flushed as one
+        item. The flush deadline is anchored when the first update is
+        buffered, so a coalesced event goes out at most _COALESCE_WINDOW
+        after its first chunk even if the stream never pauses. Completed
+        items flush immediately.
+        """
+        agent_stream = agent_stream.__aiter__()
+        loop = asyncio.get_running_loop()
+        pending = asyncio.ensure_future(agent_stream.__anext__())
+        buffered = None
+        flush_at = 0.0
+        try:
+            while True:
+                if buffered is not None:
+                    remaining = flush_at - loop.time()
+                    if remaining > 0:
+                        done, _ = await asyncio.wait({pending}, timeout=remaining)
+                    else:
+                        done = ()
+                    if not done:
+                        yield buffered
+                        buffered = None
+                        continue
+                try:
+                    item = await pending
+                except StopAsyncIteration:
+                    if buffered is not None:
+                        yield buffered
+                    return
+                pending = asyncio.ensure_future(agent_stream.__anext__())
+                if not item["is_task_complete"]:
+                    if buffered is None:
+                        buffered = {"is_task_complete": False, "updates": item["updates"]}
+                        flush_at = loop.time() + _COALESCE_WINDOW
+                    else:
+                        buffered["updates"] += item["updates"]
+                else:
+                    if buffered is not None:
+                        yield buffered
+                        buffered = None
+                    yield item
+        finally:
+            pending.cancel()
+
+    async def _produce(
+        self, request: SendTaskStreamingRequest, queue: asyncio.Queue, query: str
+    ) -> None:
         task_send_params: TaskSendParams = request.params
-        query = self._get_user_query(task_send_params)
         try:
-          async for item in self.agent.stream(query, task_send_params.sessionId):
-            is_task_complete = item["is_task_complete"]
-            artifacts = None
-            if not is_task_complete:
-              task_state = TaskState.WORKING
-              parts = [{"type": "text", "text": item["updates"]}]
-            else:
-              if isinstance(item["content"], dict):
-                if ("response" in item["content"]
-                    and "result" in item["content"]["response"]):
-                  data = json.loads(item["content"]["response"]["result"])
-                  task_state = TaskState.INPUT_REQUIRED
+            async for item in self._coalesce_updates(
+                self._agent_stream(query, task_send_params.sessionId)
+            ):
+                is_task_complete = item["is_task_complete"]
+                artifacts = None
+                # Tuples: pydantic coerces them for List[Part] fields, and a
+                # 1-tuple is smaller than a list and skips GC registration.
+                if not is_task_complete:
+                    task_state = TaskState.WORKING
+                    parts = (_text_part(item["updates"]),)
                 else:
-                  data = item["content"]
-                  task_state = TaskState.COMPLETED
-                parts = [{"type": "data", "data": data}]
-              else:
-                task_state = TaskState.COMPLETED
-                parts = [{"type": "text", "text": item["content"]}]
-              artifacts = [Artifact(parts=parts, index=0, append=False)]
-          message = Message(role="agent", parts=parts)
-          task_status = TaskStatus(state=task_state, message=message)
-          await self._update_store(task_send_params.id, task_status, artifacts)
-          task_update_event = TaskStatusUpdateEvent(
-                id=task_send_params.id,
-                status=task_status,
-                final=False,
-            )
-          yield SendTaskStreamingResponse(id=request.id, result=task_update_event)
-          if artifacts:
-            for artifact in artifacts:
-              yield SendTaskStreamingResponse(
-                  id=request.id,
-                  result=TaskArtifactUpdateEvent(
-                      id=task_send_params.id,
-                      artifact=artifact,
-                  )
-              )
-          if is_task_complete:
-            yield SendTaskStreamingResponse(
-              id=request.id,
-              result=TaskStatusUpdateEvent(
-                  id=task_send_params.id,
-                  status=TaskStatus(
-                      state=task_status.state,
-                  ),
-                  final=True
-              )
-            )
+                    if isinstance(item["content"], dict):
+                        if ("response" in item["content"]
+                            and "result" in item["content"]["response"]):
+                            result_str = item["content"]["response"]["result"]
+                            if len(result_str) > _LARGE_RESULT_BYTES:
+                                data = await asyncio.to_thread(orjson.loads, result_str)
+                            else:
+                                data = orjson.loads(result_str)
+                            task_state = TaskState.INPUT_REQUIRED
+                        else:
+                            data = item["content"]
+                            task_state = TaskState.COMPLETED
+                        parts = (_data_part(data),)
+                    else:
+                        task_state = TaskState.COMPLETED
+                        parts = (_text_part(item["content"]),)
+                    artifacts = [Artifact(parts=parts, index=0, append=False)]
+                message = Message(role=_AGENT, parts=parts)
+                task_status = TaskStatus(state=task_state, message=message)
+                await self._update_store(task_send_params.id, task_status, artifacts)
+                task_update_event = TaskStatusUpdateEvent(
+                    id=task_send_params.id,
+                    status=task_status,
+                    final=False,
+                )
+                await queue.put(
+                    SendTaskStreamingResponse(id=request.id, result=task_update_event)
+                )
+                if artifacts:
+                    for artifact in artifacts:
+                        await queue.put(
+                            SendTaskStreamingResponse(
+                                id=request.id,
+                                result=TaskArtifactUpdateEvent(
+                                    id=task_send_params.id,
+                                    artifact=artifact,
+                                )
+                            )
+                        )
+                if is_task_complete:
+                    # model_copy reuses the validated terminal status (and its
+                    # timestamp) instead of constructing a new one; the final
+                    # event carries no message.
+                    await queue.put(
+                        SendTaskStreamingResponse(
+                            id=request.id,
+                            result=TaskStatusUpdateEvent(
+                                id=task_send_params.id,
+                                status=task_status.model_copy(update={"message": None}),
+                                final=True
+                            )
+                        )
+                    )
         except Exception as e:
-            yield JSONRPCResponse(
-                id=request.id,
-                error=InternalError(
-                    message="An error occurred while streaming the response"
-                ),
+            await queue.put(
+                JSONRPCResponse(
+                    id=request.id,
+                    error=InternalError(
+                        message="An error occurred while streaming the response"
+                    ),
+                )
             )
+            await queue.put(_STREAM_DONE)
+        else:
+            # The sentinel is deliberately not in a finally block: on
+            # cancellation there is no consumer left to drain it, and the
+            # put would block on a full queue.
+            await queue.put(_STREAM_DONE)
     def _validate_request(
         self, request: Union[SendTaskRequest, SendTaskStreamingRequest]
     ):
@@ -101,44 +256,52 @@ class AgentTaskManager(InMemoryTaskManager):
         if error:
             return error
         await self.upsert_task(request.params)
-        return await self._invoke(request)
+        # Derive the query once here rather than re-walking message.parts
+        # in the handler.
+        query = self._get_user_query(request.params)
+        return await self._invoke(request, query)
     async def on_send_task_subscribe(
         self, request: SendTaskStreamingRequest
     ) -> AsyncIterable[SendTaskStreamingResponse] | JSONRPCResponse:
         error = self._validate_request(request)
         if error:
             return error
-        await self.upsert_task(request.params)
-        return self._stream_generator(request)
+        query = self._get_user_query(request.params)
+        return self._stream_generator(request, query)
     async def _update_store(
         self, task_id: str, status: TaskStatus, artifacts: list[Artifact]
     ) -> Task:
-        async with self.lock:
-            try:
-                task = self.tasks[task_id]
-            except KeyError:
+        async with self._lock_for(task_id):
+            task = self.tasks.get(task_id)
+            if task is None:
                 raise ValueError(f"Task {task_id} not found")
             task.status = status
             if artifacts is not None:
-                if task.artifacts is None:
-                    task.artifacts = []
+                # upsert_task initializes artifacts to [], so extend directly.
                 task.artifacts.extend(artifacts)
             return task
 
 
-    async def _invoke(self, request: SendTaskRequest) -> SendTaskResponse:
+    async def _invoke(self, request: SendTaskRequest, query: str) -> SendTaskResponse:
         task_send_params: TaskSendParams = request.params
-        query = self._get_user_query(task_send_params)
         try:
-            result = await self.agent.invoke(query, task_send_params.sessionId)
+            # Agents exposing a sync path run it off the event loop; async
+            # agents skip the thread hop.
+            invoke_sync = getattr(self.agent, "invoke_sync", None)
+            if invoke_sync is not None:
+                result = await asyncio.to_thread(
+                    invoke_sync, query, task_send_params.sessionId
+                )
+            else:
+                result = await self.agent.invoke(query, task_send_params.sessionId)
         except Exception as e:
             raise ValueError(f"Error invoking agent: {e}")
-        parts = [{"type": "text", "text": result}]
+        parts = (_text_part(result),)
         task_state = TaskState.INPUT_REQUIRED if "MISSING_INFO:" in result else TaskState.COMPLETED
         task = await self._update_store(
             task_send_params.id,
             TaskStatus(
-                state=task_state, message=Message(role="agent", parts=parts)
+                state=task_state, message=Message(role=_AGENT, parts=parts)
             ),
             [Artifact(parts=parts)],
         )
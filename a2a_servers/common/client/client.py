@@ -48,7 +48,11 @@ class A2AClient:
         request = SendTaskStreamingRequest(params=payload)
         with httpx.Client(timeout=None) as client:
             with connect_sse(
-                client, "POST", self.url, json=request.model_dump()
+                client,
+                "POST",
+                self.url,
+                content=request.model_dump_json(exclude_none=True),
+                headers={"Content-Type": "application/json"},
             ) as event_source:
                 try:
                     for sse in event_source.iter_sse():
@@ -63,8 +67,13 @@ class A2AClient:
             try:
                 # Image generation could take time, adding timeout
                 print(f" -----> {self.url}")
+                # model_dump_json serializes in pydantic's Rust core, skipping
+                # the intermediate dict + stdlib json encode that json= incurs.
                 response = await client.post(
-                    self.url, json=request.model_dump(), timeout=600
+                    self.url,
+                    content=request.model_dump_json(exclude_none=True),
+                    headers={"Content-Type": "application/json"},
+                    timeout=600,
                 )
                 response.raise_for_status()
                 return response.json()
@@ -192,6 +192,7 @@ class InMemoryTaskManager(TaskManager):
                     sessionId = task_send_params.sessionId,
                     messages=[task_send_params.message],
                     status=TaskStatus(state=TaskState.SUBMITTED),
+                    artifacts=[],
                     history=[task_send_params.message],
                 )
                 self.tasks[task_send_params.id] = task